@@ -2,30 +2,46 @@
 from __future__ import annotations
 
 import sys
-import warnings
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
 from ._api import AsyncAcquireReturnProxy, BaseFileLock
 from ._error import Timeout
-from ._soft import SoftFileLock
-from ._unix import UnixFileLock, has_fcntl
-from ._windows import WindowsFileLock
 
-if sys.platform == "win32":  # pragma: win32 cover
-    _FileLock: type[BaseFileLock] = WindowsFileLock
-else:  # pragma: win32 no cover # noqa: PLR5501
+if TYPE_CHECKING:
+    # these are runtime names too, but only via the module __getattr__ below - moving them out of
+    # this block (as ruff's TCH004 fix would) would re-import every backend eagerly
+    from ._soft import SoftFileLock  # noqa: TCH004
+    from ._unix import UnixFileLock  # noqa: TCH004
+    from ._windows import WindowsFileLock  # noqa: TCH004
+
+    #: Alias for the lock, which should be used for the current platform.
+    FileLock = SoftFileLock
+elif sys.platform == "win32":  # pragma: win32 cover
+    from ._windows import WindowsFileLock as FileLock
+else:  # pragma: win32 no cover
+    from ._unix import has_fcntl
+
     if has_fcntl:
-        _FileLock: type[BaseFileLock] = UnixFileLock
+        from ._unix import UnixFileLock as FileLock
     else:
-        _FileLock = SoftFileLock
-        if warnings is not None:
-            warnings.warn("only soft file lock is available", stacklevel=2)
+        import warnings
 
-if TYPE_CHECKING:  # noqa: SIM108
-    FileLock = SoftFileLock
-else:
-    #: Alias for the lock, which should be used for the current platform.
-    FileLock = _FileLock
+        warnings.warn("only soft file lock is available", stacklevel=2)
+        from ._soft import SoftFileLock as FileLock
+
+#: modules holding the platform specific names, imported on first attribute access (PEP 562) so that
+#: importing the package only pays for the backend selected above
+_BACKENDS = {"SoftFileLock": "_soft", "UnixFileLock": "_unix", "WindowsFileLock": "_windows", "has_fcntl": "_unix"}
+
+
+def __getattr__(name: str) -> bool | type[BaseFileLock]:
+    module = _BACKENDS.get(name)
+    if module is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    from importlib import import_module
+
+    return cast("bool | type[BaseFileLock]", getattr(import_module(f"{__name__}.{module}"), name))
 
 
 __all__ = [
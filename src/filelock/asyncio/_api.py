@@ -11,12 +11,9 @@ from dataclasses import dataclass
 from threading import local
 from typing import TYPE_CHECKING, Any
 
-from ._error import Timeout
+from filelock.vendor.async_timeout import timeout as atimeout
 
-if sys.version_info >= (3, 11):
-    from asyncio import timeout as atimeout
-else:
-    from filelock.vendor.async_timeout import timeout as atimeout
+from ._error import Timeout
 
 if sys.version_info >= (3, 10):
     from contextlib import AsyncContextDecorator
@@ -26,6 +23,8 @@ else:
 
 @asynccontextmanager
 async def async_timeout(timeout: float | None, lock_filename: str) -> None:
+    if timeout is not None and timeout < 0:  # a negative timeout means block without a deadline
+        timeout = None
     try:
         async with atimeout(timeout):
             yield
@@ -233,20 +232,29 @@ class BaseFileLock(ABC, AsyncContextDecorator):
         lock_id = id(self)
         lock_filename = self.lock_file
         try:
-            async with async_timeout(timeout, lock_filename):
-                while True:
-                    if not self.is_locked:
-                        _LOGGER.debug("Attempting to acquire lock %s on %s", lock_id, lock_filename)
-                        self._acquire()
-                    if self.is_locked:
-                        _LOGGER.debug("Lock %s acquired on %s", lock_id, lock_filename)
-                        break
-                    if blocking is False:
-                        _LOGGER.debug("Failed to immediately acquire lock %s on %s", lock_id, lock_filename)
-                        raise Timeout(lock_filename)  # noqa: TRY301
-                    msg = "Lock %s not acquired on %s, waiting %s seconds ..."
-                    _LOGGER.debug(msg, lock_id, lock_filename, poll_interval)
-                    await asyncio.sleep(poll_interval)
+            # Make the first attempt before entering the timeout context, so that the uncontended
+            # acquire never pays for the timeout machinery and a timeout of 0 still means exactly
+            # one attempt even when the deadline is already expired on enter.
+            if not self.is_locked:
+                _LOGGER.debug("Attempting to acquire lock %s on %s", lock_id, lock_filename)
+                self._acquire()
+            if self.is_locked:
+                _LOGGER.debug("Lock %s acquired on %s", lock_id, lock_filename)
+            elif blocking is False:
+                _LOGGER.debug("Failed to immediately acquire lock %s on %s", lock_id, lock_filename)
+                raise Timeout(lock_filename)  # noqa: TRY301
+            else:
+                async with async_timeout(timeout, lock_filename):
+                    while True:
+                        msg = "Lock %s not acquired on %s, waiting %s seconds ..."
+                        _LOGGER.debug(msg, lock_id, lock_filename, poll_interval)
+                        await asyncio.sleep(poll_interval)
+                        if not self.is_locked:
+                            _LOGGER.debug("Attempting to acquire lock %s on %s", lock_id, lock_filename)
+                            self._acquire()
+                        if self.is_locked:
+                            _LOGGER.debug("Lock %s acquired on %s", lock_id, lock_filename)
+                            break
         except BaseException:  # Something did go wrong, so decrement the counter.
             self._context.lock_counter = max(0, self._context.lock_counter - 1)
             raise
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import inspect
 import logging
 import os
@@ -276,6 +277,57 @@ async def test_default_timeout(lock_type: type[BaseFileLock], tmp_path: Path) ->
     assert not lock_2.is_locked
 
 
+@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock])
+async def test_timeout_zero_makes_exactly_one_attempt(
+    lock_type: type[BaseFileLock],
+    tmp_path: Path,
+    mocker: MockerFixture,
+) -> None:
+    # a timeout of 0 means exactly one attempt: an uncontended acquire succeeds on it, a
+    # contended one raises Timeout without polling again
+    lock_path = tmp_path / "a"
+    lock_1, lock_2 = lock_type(str(lock_path)), lock_type(str(lock_path))
+
+    await lock_2.acquire(timeout=0)
+    assert lock_2.is_locked
+    lock_2.release()
+    assert not lock_2.is_locked
+
+    await lock_1.acquire()
+    attempts = mocker.spy(lock_2, "_acquire")
+    with pytest.raises(Timeout, match="The file lock '.*' could not be acquired."):
+        await lock_2.acquire(timeout=0)
+    assert attempts.call_count == 1
+    assert not lock_2.is_locked
+
+    lock_1.release()
+    assert not lock_1.is_locked
+
+
+@pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock])
+async def test_default_timeout_blocks_until_released(lock_type: type[BaseFileLock], tmp_path: Path) -> None:
+    # a negative default timeout means there is no deadline: the acquire keeps polling and
+    # succeeds once the lock is released instead of raising Timeout
+    lock_path = tmp_path / "a"
+    lock_1, lock_2 = lock_type(str(lock_path)), lock_type(str(lock_path))
+
+    await lock_1.acquire()
+    assert lock_1.is_locked
+    assert not lock_2.is_locked
+
+    async def release_lock_1() -> None:
+        await asyncio.sleep(0.1)
+        lock_1.release()
+
+    release_task = asyncio.ensure_future(release_lock_1())
+    async with await lock_2.acquire(poll_interval=0.01) as lock:
+        assert lock is lock_2
+        assert lock_2.is_locked
+        assert not lock_1.is_locked
+    await release_task
+    assert not lock_2.is_locked
+
+
 @pytest.mark.parametrize("lock_type", [FileLock, SoftFileLock])
 async def test_context_release_on_exc(lock_type: type[BaseFileLock], tmp_path: Path) -> None:
     # lock is released when an exception is thrown in a with-statement